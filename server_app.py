@@ -1,6 +1,8 @@
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
 from werkzeug.security import generate_password_hash, check_password_hash
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -13,18 +15,57 @@ import time
 import datetime
 import json
 import os
+import collections
+import sys
+import contextlib
 import secrets
+import csv
+import io
+import re
+import hashlib
+import heapq
+import itertools
+import socket
+import struct
+import email.utils
 from functools import wraps
 import schedule
 import atexit
+import requests
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(32))
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///gw_registration.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///gw_registration.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['REHEARSAL_LEAD_MINUTES'] = int(os.environ.get('REHEARSAL_LEAD_MINUTES', 30))
+app.config['REGISTRATION_ENGINE'] = os.environ.get('REGISTRATION_ENGINE', 'http')
+app.config['SSB_BASE_URL'] = os.environ.get('SSB_BASE_URL', 'https://bssoweb.gwu.edu:8002/StudentRegistrationSsb')
+app.config['CLOCK_REFERENCE'] = os.environ.get('CLOCK_REFERENCE', app.config['SSB_BASE_URL'])
+app.config['CLOCK_CALIBRATION_SAMPLES'] = int(os.environ.get('CLOCK_CALIBRATION_SAMPLES', 5))
+app.config['CLOCK_CALIBRATION_MINUTES'] = int(os.environ.get('CLOCK_CALIBRATION_MINUTES', 30))
+app.config['PROFILE_JOBS'] = os.environ.get('PROFILE_JOBS', '').lower() in ('1', 'true', 'yes')
+app.config['PROFILE_INTERVAL_MS'] = int(os.environ.get('PROFILE_INTERVAL_MS', 10))
+app.config['PROFILE_DIR'] = os.path.abspath(os.environ.get('PROFILE_DIR', 'profiles'))
 
 db = SQLAlchemy(app)
 
+BULK_JOB_LIMIT = 1000
+RESPONSE_CACHE_SIZE = 256
+HTTP_ENGINE_TIMEOUT = 15
+CLOCK_SAMPLE_TIMEOUT = 5
+NTP_EPOCH_DELTA = 2208988800
+
+SUCCESS_INDICATORS = ["successfully", "registered", "added to your schedule", "registration successful"]
+ERROR_INDICATORS = ["error", "failed", "unable to register", "registration failed", "closed", "full", "prerequisite", "restriction", "time conflict", "hold", "not eligible"]
+
+REHEARSAL_CANCEL_TIMEOUT = 30
+
+class EngineUnavailable(Exception):
+    pass
+
+class RehearsalCancelled(Exception):
+    pass
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
@@ -50,6 +91,10 @@ class RegistrationJob(db.Model):
     gw_username = db.Column(db.String(100), nullable=True)
     gw_password = db.Column(db.String(200), nullable=True)
     term = db.Column(db.String(50), nullable=True)
+    rehearse = db.Column(db.Boolean, default=False)
+    rehearsal_status = db.Column(db.String(20), nullable=True)
+    rehearsal_report = db.Column(db.Text, nullable=True)
+    rehearsed_at = db.Column(db.DateTime, nullable=True)
 
 class RegistrationLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -67,6 +112,102 @@ class SavedSchedule(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
     last_used = db.Column(db.DateTime, nullable=True)
 
+response_cache = collections.OrderedDict()
+response_cache_version = 0
+response_cache_lock = threading.Lock()
+
+def cache_version():
+    with response_cache_lock:
+        return response_cache_version
+
+def get_cached_response(key):
+    with response_cache_lock:
+        entry = response_cache.get(key)
+        if entry is not None:
+            response_cache.move_to_end(key)
+        return entry
+
+def store_cached_response(key, version, entry):
+    with response_cache_lock:
+        if response_cache_version == version:
+            response_cache[key] = entry
+            response_cache.move_to_end(key)
+            while len(response_cache) > RESPONSE_CACHE_SIZE:
+                response_cache.popitem(last=False)
+    return entry
+
+def invalidate_cached_responses(keys):
+    global response_cache_version
+    with response_cache_lock:
+        response_cache_version += 1
+        for key in keys:
+            response_cache.pop(key, None)
+
+def cache_keys_for(obj):
+    if isinstance(obj, RegistrationJob):
+        return [('job-status', obj.id), ('job-logs', obj.id)]
+    if isinstance(obj, RegistrationLog):
+        return [('job-status', obj.job_id), ('job-logs', obj.job_id)]
+    if isinstance(obj, SavedSchedule):
+        return [('schedules', obj.user_id)]
+    return []
+
+@event.listens_for(Session, 'after_flush')
+def collect_invalidated_responses(db_session, flush_context):
+    keys = db_session.info.setdefault('invalidated_responses', set())
+    for obj in list(db_session.new) + list(db_session.dirty) + list(db_session.deleted):
+        keys.update(cache_keys_for(obj))
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_committed_responses(db_session):
+    keys = db_session.info.pop('invalidated_responses', None)
+    if keys:
+        invalidate_cached_responses(keys)
+
+@event.listens_for(Session, 'after_soft_rollback')
+def discard_invalidated_responses(db_session, previous_transaction):
+    db_session.info.pop('invalidated_responses', None)
+
+def job_cache_entry(job, logs, payload):
+    last_log_id = max((log.id for log in logs), default=0)
+    last_modified = max([job.created_at] + [value for value in (job.completed_at, job.rehearsed_at) if value] + [log.timestamp for log in logs])
+    return {
+        'owner_id': job.user_id,
+        'etag': f"job-{job.id}-{job.status}-{job.rehearsal_status}-{last_log_id}",
+        'last_modified': last_modified.replace(tzinfo=datetime.timezone.utc),
+        'payload': payload
+    }
+
+def conditional_json(entry):
+    last_modified = entry['last_modified']
+    if last_modified and datetime.datetime.now(datetime.timezone.utc) - last_modified < datetime.timedelta(seconds=1):
+        last_modified = None
+    elif last_modified:
+        last_modified = last_modified.replace(microsecond=0)
+    
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(entry['etag'])
+    else:
+        not_modified = bool(last_modified and request.if_modified_since and last_modified <= request.if_modified_since)
+    
+    response = app.response_class(status=304) if not_modified else jsonify(entry['payload'])
+    response.set_etag(entry['etag'], weak=True)
+    if last_modified:
+        response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    return response
+
+def parse_scheduled_time(value):
+    scheduled_time = datetime.datetime.fromisoformat(str(value or '').strip().replace('Z', '+00:00'))
+    return scheduled_time.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+def utc_isoformat(value):
+    return value.replace(tzinfo=datetime.timezone.utc).isoformat() if value else None
+
+@app.template_filter('from_json')
+def from_json_filter(value):
+    return json.loads(value) if value else []
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -132,7 +273,12 @@ def logout():
 def dashboard():
     user = User.query.get(session['user_id'])
     jobs = RegistrationJob.query.filter_by(user_id=user.id).order_by(RegistrationJob.created_at.desc()).limit(10).all()
-    return render_template('dashboard.html', user=user, jobs=jobs)
+    return render_template('dashboard.html', user=user, jobs=jobs, clock=clock_status())
+
+@app.route('/clock-status')
+@login_required
+def clock_status_view():
+    return jsonify(clock_status())
 
 @app.route('/setup-credentials', methods=['GET', 'POST'])
 @login_required
@@ -162,7 +308,7 @@ def create_job():
     scheduled_time_str = data.get('scheduled_time')
     
     try:
-        scheduled_time = datetime.datetime.fromisoformat(scheduled_time_str.replace('Z', '+00:00'))
+        scheduled_time = parse_scheduled_time(scheduled_time_str)
     except ValueError:
         return jsonify({'error': 'Invalid date format'}), 400
     
@@ -179,7 +325,8 @@ def create_job():
     job = RegistrationJob(
         user_id=session['user_id'],
         crns=json.dumps(crns),
-        scheduled_time=scheduled_time
+        scheduled_time=scheduled_time,
+        rehearse=bool(data.get('rehearse'))
     )
     
     db.session.add(job)
@@ -189,20 +336,151 @@ def create_job():
     
     return jsonify({'success': True, 'job_id': job.id})
 
+@app.route('/bulk-create-jobs', methods=['POST'])
+@login_required
+def bulk_create_jobs():
+    if request.is_json:
+        data = request.get_json()
+        rows = data.get('jobs', []) if isinstance(data, dict) else data
+    else:
+        upload = request.files.get('file')
+        text = upload.read().decode('utf-8-sig') if upload else request.get_data(as_text=True)
+        rows = list(csv.DictReader(io.StringIO(text)))
+    
+    if not isinstance(rows, list) or not rows:
+        return jsonify({'error': 'No jobs provided'}), 400
+    
+    if len(rows) > BULK_JOB_LIMIT:
+        return jsonify({'error': f'At most {BULK_JOB_LIMIT} jobs can be created per request'}), 400
+    
+    saved_schedules = {s.id: s for s in SavedSchedule.query.filter_by(user_id=session['user_id']).all()}
+    now = datetime.datetime.utcnow()
+    
+    results = []
+    jobs = []
+    for row_number, row in enumerate(rows, start=1):
+        job, error = build_bulk_job(row, saved_schedules, now)
+        if error:
+            results.append({'row': row_number, 'success': False, 'error': error})
+            continue
+        jobs.append(job)
+        results.append({'row': row_number, 'success': True})
+    
+    if not jobs:
+        return jsonify({'success': False, 'created': 0, 'results': results}), 400
+    
+    db.session.add_all(jobs)
+    db.session.commit()
+    
+    schedule_jobs(jobs)
+    
+    job_ids = iter(job.id for job in jobs)
+    for result in results:
+        if result['success']:
+            result['job_id'] = next(job_ids)
+    
+    return jsonify({'success': True, 'created': len(jobs), 'failed': len(rows) - len(jobs), 'results': results})
+
+def build_bulk_job(row, saved_schedules, now):
+    if not isinstance(row, dict):
+        return None, 'Row must be an object'
+    
+    try:
+        scheduled_time = parse_scheduled_time(row.get('scheduled_time'))
+    except ValueError:
+        return None, 'Invalid date format'
+    
+    if scheduled_time <= server_utcnow():
+        return None, 'Scheduled time is in the past'
+    
+    schedule_id = row.get('schedule_id')
+    crns = row.get('crns') or []
+    if schedule_id:
+        try:
+            saved_schedule = saved_schedules.get(int(schedule_id))
+        except (TypeError, ValueError):
+            saved_schedule = None
+        if not saved_schedule:
+            return None, 'Invalid schedule selected'
+        crns = json.loads(saved_schedule.crns)
+        saved_schedule.last_used = now
+    elif isinstance(crns, str):
+        crns = [crn for crn in re.split(r'[\s,;]+', crns) if crn]
+    elif not isinstance(crns, list) or not all(isinstance(crn, (str, int)) and not isinstance(crn, bool) for crn in crns):
+        return None, 'CRNs must be a list or string'
+    
+    crns = [str(crn).strip() for crn in crns if str(crn).strip()]
+    if not crns:
+        return None, 'No CRNs provided'
+    
+    term = str(row.get('term') or '').strip() or None
+    rehearse = row.get('rehearse')
+    if isinstance(rehearse, str):
+        rehearse = rehearse.strip().lower() in ('1', 'true', 'yes')
+    
+    job = RegistrationJob(
+        user_id=session['user_id'],
+        crns=json.dumps(crns),
+        scheduled_time=scheduled_time,
+        term=term,
+        rehearse=bool(rehearse)
+    )
+    return job, None
+
 @app.route('/job-status/<int:job_id>')
 @login_required
 def job_status(job_id):
+    key = ('job-status', job_id)
+    entry = get_cached_response(key)
+    
+    if entry is None:
+        version = cache_version()
+        job = RegistrationJob.query.get(job_id)
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        logs = RegistrationLog.query.filter_by(job_id=job_id).order_by(RegistrationLog.timestamp.desc()).all()
+        
+        entry = store_cached_response(key, version, job_cache_entry(job, logs, {
+            'status': job.status,
+            'error_message': job.error_message,
+            'rehearsal': rehearsal_summary(job),
+            'logs': [{'message': log.message, 'timestamp': utc_isoformat(log.timestamp), 'level': log.level} for log in logs]
+        }))
+    
+    if entry['owner_id'] != session['user_id']:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    return conditional_json(entry)
+
+def rehearsal_summary(job):
+    if not job.rehearsal_status:
+        return None
+    report = json.loads(job.rehearsal_report) if job.rehearsal_report else {}
+    return {
+        'status': job.rehearsal_status,
+        'rehearsed_at': utc_isoformat(job.rehearsed_at),
+        'steps': report.get('steps', []),
+        'problems': report.get('problems', []),
+        'total_seconds': report.get('total_seconds')
+    }
+
+@app.route('/rehearse-job/<int:job_id>', methods=['POST'])
+@login_required
+def rehearse_job_now(job_id):
     job = RegistrationJob.query.get(job_id)
     if not job or job.user_id != session['user_id']:
         return jsonify({'error': 'Job not found'}), 404
     
-    logs = RegistrationLog.query.filter_by(job_id=job_id).order_by(RegistrationLog.timestamp.desc()).all()
+    if job.status != 'pending':
+        return jsonify({'error': 'Only pending jobs can be rehearsed'}), 400
     
-    return jsonify({
-        'status': job.status,
-        'error_message': job.error_message,
-        'logs': [{'message': log.message, 'timestamp': log.timestamp.isoformat(), 'level': log.level} for log in logs]
-    })
+    if not rehearsal_window_open(job):
+        return jsonify({'error': f"Rehearsals must start at least {app.config['REHEARSAL_LEAD_MINUTES']} minutes before the scheduled time"}), 400
+    
+    start_background_job(rehearse_job, job_id)
+    
+    return jsonify({'success': True, 'message': 'Rehearsal started'})
 
 @app.route('/test-login', methods=['POST'])
 @login_required
@@ -284,42 +562,76 @@ def delete_schedule(schedule_id):
 @app.route('/get-schedules')
 @login_required
 def get_schedules():
-    schedules = SavedSchedule.query.filter_by(user_id=session['user_id']).order_by(SavedSchedule.created_at.desc()).all()
-    return jsonify({
-        'schedules': [{
-            'id': s.id,
-            'name': s.name,
-            'crns': json.loads(s.crns),
-            'description': s.description,
-            'created_at': s.created_at.isoformat(),
-            'last_used': s.last_used.isoformat() if s.last_used else None
-        } for s in schedules]
-    })
+    key = ('schedules', session['user_id'])
+    entry = get_cached_response(key)
+    
+    if entry is None:
+        version = cache_version()
+        schedules = SavedSchedule.query.filter_by(user_id=session['user_id']).order_by(SavedSchedule.created_at.desc()).all()
+        payload = {
+            'schedules': [{
+                'id': s.id,
+                'name': s.name,
+                'crns': json.loads(s.crns),
+                'description': s.description,
+                'created_at': utc_isoformat(s.created_at),
+                'last_used': utc_isoformat(s.last_used)
+            } for s in schedules]
+        }
+        entry = store_cached_response(key, version, {
+            'owner_id': session['user_id'],
+            'etag': 'schedules-' + hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest(),
+            'last_modified': None,
+            'payload': payload
+        })
+    
+    return conditional_json(entry)
 
 @app.route('/job-logs/<int:job_id>')
 def job_logs(job_id):
+    key = ('job-logs', job_id)
+    entry = get_cached_response(key)
+    
+    if entry is None:
+        version = cache_version()
+        job = RegistrationJob.query.get(job_id)
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        logs = RegistrationLog.query.filter_by(job_id=job_id).order_by(RegistrationLog.timestamp.desc()).all()
+        
+        entry = store_cached_response(key, version, job_cache_entry(job, logs, {
+            'job': {
+                'id': job.id,
+                'status': job.status,
+                'scheduled_time': utc_isoformat(job.scheduled_time),
+                'created_at': utc_isoformat(job.created_at),
+                'completed_at': utc_isoformat(job.completed_at),
+                'error_message': job.error_message,
+                'rehearsal': rehearsal_summary(job),
+                'profiles': [url_for('job_profile', job_id=job.id, filename=filename) for filename in job_profile_files(job.id)]
+            },
+            'logs': [{
+                'id': log.id,
+                'message': log.message,
+                'level': log.level,
+                'timestamp': utc_isoformat(log.timestamp)
+            } for log in logs]
+        }))
+    
+    return conditional_json(entry)
+
+@app.route('/job-profile/<int:job_id>/<filename>')
+@login_required
+def job_profile(job_id, filename):
     job = RegistrationJob.query.get(job_id)
-    if not job:
-        return jsonify({'error': 'Job not found'}), 404
+    if not job or job.user_id not in (None, session['user_id']):
+        return jsonify({'error': 'Profile not found'}), 404
     
-    logs = RegistrationLog.query.filter_by(job_id=job_id).order_by(RegistrationLog.timestamp.desc()).all()
+    if filename not in job_profile_files(job_id):
+        return jsonify({'error': 'Profile not found'}), 404
     
-    return jsonify({
-        'job': {
-            'id': job.id,
-            'status': job.status,
-            'scheduled_time': job.scheduled_time.isoformat(),
-            'created_at': job.created_at.isoformat(),
-            'completed_at': job.completed_at.isoformat() if job.completed_at else None,
-            'error_message': job.error_message
-        },
-        'logs': [{
-            'id': log.id,
-            'message': log.message,
-            'level': log.level,
-            'timestamp': log.timestamp.isoformat()
-        } for log in logs]
-    })
+    return send_from_directory(app.config['PROFILE_DIR'], filename, mimetype='text/plain')
 
 @app.route('/quick-register', methods=['GET', 'POST'])
 def quick_register():
@@ -354,7 +666,7 @@ def quick_register():
                 return jsonify({'error': 'Please select a term'}), 400
             
             try:
-                scheduled_time = datetime.datetime.fromisoformat(scheduled_time_str.replace('Z', '+00:00'))
+                scheduled_time = parse_scheduled_time(scheduled_time_str)
             except ValueError:
                 return jsonify({'error': 'Invalid date format'}), 400
             
@@ -364,7 +676,8 @@ def quick_register():
                 scheduled_time=scheduled_time,
                 gw_username=gw_username,
                 gw_password=gw_password,
-                term=term
+                term=term,
+                rehearse=bool(data.get('rehearse'))
             )
             
             db.session.add(job)
@@ -479,6 +792,60 @@ def load_cookies_to_driver(driver, cookies_json):
         print(f"Cookie loading error: {e}")
         return False
 
+def job_profile_files(job_id):
+    prefix = f"job-{job_id}-"
+    try:
+        filenames = os.listdir(app.config['PROFILE_DIR'])
+    except FileNotFoundError:
+        return []
+    return sorted(filename for filename in filenames if filename.startswith(prefix) and filename.endswith('.folded'))
+
+def collapsed_stack(thread_name, frame):
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    frames.append(thread_name)
+    return ';'.join(reversed(frames))
+
+def sample_stacks(threads, counts, stop, interval):
+    while not stop.wait(interval):
+        frames = sys._current_frames()
+        for thread_name, thread_id in threads:
+            frame = frames.get(thread_id)
+            if frame is not None:
+                stack = collapsed_stack(thread_name, frame)
+                counts[stack] = counts.get(stack, 0) + 1
+
+@contextlib.contextmanager
+def profiled_attempt(job_id, label):
+    if not app.config['PROFILE_JOBS']:
+        yield
+        return
+    
+    threads = [('job', threading.get_ident()), ('scheduler', scheduler_thread.ident)]
+    counts = {}
+    stop = threading.Event()
+    sampler = threading.Thread(target=sample_stacks, args=(threads, counts, stop, app.config['PROFILE_INTERVAL_MS'] / 1000), daemon=True)
+    sampler.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        sampler.join()
+        
+        filename = f"job-{job_id}-{label}-{datetime.datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.folded"
+        try:
+            os.makedirs(app.config['PROFILE_DIR'], exist_ok=True)
+            with open(os.path.join(app.config['PROFILE_DIR'], filename), 'w') as profile_file:
+                for stack, count in sorted(counts.items()):
+                    profile_file.write(f"{stack} {count}\n")
+        except OSError as e:
+            log_job_message(job_id, f"Could not write profile {filename}: {e}", 'warning')
+        else:
+            log_job_message(job_id, f"Profile written: {filename} ({sum(counts.values())} samples)")
+
 def execute_registration_job(job_id):
     job = RegistrationJob.query.get(job_id)
     if not job:
@@ -487,6 +854,8 @@ def execute_registration_job(job_id):
     job.status = 'running'
     db.session.commit()
     
+    cancel_rehearsal(job_id)
+    
     log_job_message(job_id, f"Starting FAST registration job for {len(json.loads(job.crns))} CRNs")
     
     max_attempts = 5
@@ -496,7 +865,8 @@ def execute_registration_job(job_id):
         attempt += 1
         log_job_message(job_id, f"Registration attempt {attempt}/{max_attempts}")
         
-        success = try_registration(job_id, job)
+        with profiled_attempt(job_id, f"attempt-{attempt}"):
+            success = try_registration(job_id, job)
         
         if success:
             log_job_message(job_id, f"Registration successful on attempt {attempt}")
@@ -515,28 +885,72 @@ def execute_registration_job(job_id):
             db.session.commit()
             return
 
-def try_registration(job_id, job):
+def rehearsal_step(rehearsal, name):
+    if rehearsal is not None:
+        if rehearsal['cancelled'].is_set():
+            raise RehearsalCancelled()
+        now = time.monotonic()
+        rehearsal['steps'].append({'step': name, 'seconds': round(now - rehearsal['last_mark'], 2)})
+        rehearsal['last_mark'] = now
+
+def registration_failed(job_id, rehearsal, message, level='info'):
+    log_job_message(job_id, message, level)
+    if rehearsal is not None:
+        rehearsal['problems'].append(message)
+    return False
+
+def registration_credentials(job):
     if job.user_id:
         user = User.query.get(job.user_id)
         if not user or not user.gw_username or not user.gw_password:
-            return False
-        gw_username = user.gw_username
-        gw_password = user.gw_password
-        session_cookies = user.session_cookies
-        cookies_expiry = user.cookies_expiry
+            return None
+        return {
+            'user': user,
+            'gw_username': user.gw_username,
+            'gw_password': user.gw_password,
+            'session_cookies': user.session_cookies,
+            'cookies_expiry': user.cookies_expiry
+        }
     elif job.gw_username and job.gw_password:
-        gw_username = job.gw_username
-        gw_password = job.gw_password
-        session_cookies = None
-        cookies_expiry = None
-    else:
-        return False
+        return {
+            'user': None,
+            'gw_username': job.gw_username,
+            'gw_password': job.gw_password,
+            'session_cookies': None,
+            'cookies_expiry': None
+        }
+    return None
+
+def try_registration(job_id, job, rehearsal=None):
+    credentials = registration_credentials(job)
+    if not credentials:
+        return registration_failed(job_id, rehearsal, "GW credentials not configured")
+    
+    engine_names = [app.config['REGISTRATION_ENGINE']]
+    if engine_names[0] != 'selenium':
+        engine_names.append('selenium')
+    
+    for engine_name in engine_names:
+        try:
+            return REGISTRATION_ENGINES[engine_name](job_id, job, credentials, rehearsal)
+        except EngineUnavailable as e:
+            log_job_message(job_id, f"{engine_name} engine unavailable ({e}), falling back", 'warning')
+    
+    return registration_failed(job_id, rehearsal, "No registration engine available")
+
+def try_selenium_registration(job_id, job, credentials, rehearsal=None):
+    user = credentials['user']
+    gw_username = credentials['gw_username']
+    gw_password = credentials['gw_password']
+    session_cookies = credentials['session_cookies']
+    cookies_expiry = credentials['cookies_expiry']
     
     driver = create_driver(headless=True)
     if not driver:
-        return False
+        return registration_failed(job_id, rehearsal, "Failed to create browser driver")
     
     try:
+        rehearsal_step(rehearsal, 'create_driver')
         cookies_loaded = False
         if session_cookies and cookies_expiry and cookies_expiry > datetime.datetime.utcnow():
             log_job_message(job_id, "Using saved cookies for instant login")
@@ -547,18 +961,20 @@ def try_registration(job_id, job):
             temp_user = type('User', (), {'gw_username': gw_username, 'gw_password': gw_password})()
             success, cookies = perform_login_and_save_cookies(driver, temp_user)
             if not success:
-                return False
+                return registration_failed(job_id, rehearsal, "Fresh login failed - credentials may be invalid or expired")
             
             if job.user_id:
                 user.session_cookies = json.dumps(cookies)
                 user.cookies_expiry = datetime.datetime.utcnow() + datetime.timedelta(hours=24)
                 db.session.commit()
+        rehearsal_step(rehearsal, 'login')
         
-        driver.get("https://bssoweb.gwu.edu:8002/StudentRegistrationSsb/ssb/term/termSelection?mode=registration")
+        driver.get(f"{app.config['SSB_BASE_URL']}/ssb/term/termSelection?mode=registration")
         log_job_message(job_id, "Navigated to term selection page")
         
         wait = WebDriverWait(driver, 10)
         wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        rehearsal_step(rehearsal, 'term_selection_page')
         
         if job.term:
             try:
@@ -573,22 +989,22 @@ def try_registration(job_id, job):
                 log_job_message(job_id, "Submitted term selection")
                 time.sleep(3)
                 
-                driver.get("https://bssoweb.gwu.edu:8002/StudentRegistrationSsb/ssb/classRegistration/classRegistration")
+                driver.get(f"{app.config['SSB_BASE_URL']}/ssb/classRegistration/classRegistration")
                 log_job_message(job_id, "Navigated to class registration page after term selection")
                 time.sleep(2)
+                rehearsal_step(rehearsal, 'select_term')
                 
             except Exception as e:
-                log_job_message(job_id, f"Could not select term: {e}")
-                return False
+                return registration_failed(job_id, rehearsal, f"Could not select term: {e}")
         
         try:
             enter_crns_tab = driver.find_element(By.XPATH, "//a[contains(text(), 'Enter CRNs')]")
             enter_crns_tab.click()
             log_job_message(job_id, "Clicked Enter CRNs tab")
             time.sleep(2)
+            rehearsal_step(rehearsal, 'enter_crns_tab')
         except Exception as e:
-            log_job_message(job_id, f"Could not find Enter CRNs tab: {e}")
-            return False
+            return registration_failed(job_id, rehearsal, f"Could not find Enter CRNs tab: {e}")
         
         crns = json.loads(job.crns)
         log_job_message(job_id, f"Attempting to register for CRNs: {', '.join(crns)}")
@@ -608,8 +1024,17 @@ def try_registration(job_id, job):
                     time.sleep(1)
                     
             except Exception as e:
-                log_job_message(job_id, f"Error entering CRN {crn}: {str(e)}")
-                return False
+                return registration_failed(job_id, rehearsal, f"Error entering CRN {crn}: {str(e)}")
+        rehearsal_step(rehearsal, 'enter_crns')
+        
+        if rehearsal is not None:
+            try:
+                driver.find_element(By.ID, "register_button")
+                rehearsal_step(rehearsal, 'locate_submit')
+                log_job_message(job_id, "Dry run: submit button located, stopping before submit")
+                return True
+            except Exception as e:
+                return registration_failed(job_id, rehearsal, f"Could not find submit button: {e}")
         
         try:
             submit_button = driver.find_element(By.ID, "register_button")
@@ -617,8 +1042,7 @@ def try_registration(job_id, job):
             log_job_message(job_id, "Clicked Submit button")
             time.sleep(3)
         except Exception as e:
-            log_job_message(job_id, f"Could not find submit button: {e}")
-            return False
+            return registration_failed(job_id, rehearsal, f"Could not find submit button: {e}")
         
         time.sleep(3)
         
@@ -627,13 +1051,7 @@ def try_registration(job_id, job):
         
         log_job_message(job_id, f"Registration attempt completed. Page content: {page_text[:500]}...")
         
-        success_indicators = ["successfully", "registered", "added to your schedule", "registration successful"]
-        error_indicators = ["error", "failed", "unable to register", "registration failed", "closed", "full", "prerequisite", "restriction", "time conflict", "hold", "not eligible"]
-        
-        page_lower = page_text.lower()
-        
-        has_success = any(indicator in page_lower for indicator in success_indicators)
-        has_error = any(indicator in page_lower for indicator in error_indicators)
+        has_success, has_error = registration_page_outcome(page_text)
         
         if has_success and not has_error:
             log_job_message(job_id, "✅ Registration appears successful!")
@@ -658,33 +1076,459 @@ def try_registration(job_id, job):
             return False
         
     except Exception as e:
-        log_job_message(job_id, f"Registration failed: {str(e)}", "error")
-        return False
+        return registration_failed(job_id, rehearsal, f"Registration failed: {str(e)}", "error")
     
     finally:
         driver.quit()
 
+def registration_page_outcome(page_text):
+    page_lower = page_text.lower()
+    has_success = any(indicator in page_lower for indicator in SUCCESS_INDICATORS)
+    has_error = any(indicator in page_lower for indicator in ERROR_INDICATORS)
+    return has_success, has_error
+
+http_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+http_account_locks = {}
+http_account_locks_lock = threading.Lock()
+
+def new_http_session(cookies):
+    http_session = requests.Session()
+    http_session.mount('https://', http_adapter)
+    http_session.mount('http://', http_adapter)
+    http_session.headers['User-Agent'] = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    for cookie in cookies:
+        http_session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+    return http_session
+
+def http_account_lock(gw_username):
+    with http_account_locks_lock:
+        return http_account_locks.setdefault(gw_username, threading.Lock())
+
+def synchronizer_token(html):
+    tag = re.search(r'<meta[^>]*name="synchronizerToken"[^>]*>', html)
+    match = tag and re.search(r'content="([^"]*)"', tag.group(0))
+    return match.group(1) if match else None
+
+def ssb_json(response):
+    if response.status_code >= 400:
+        raise EngineUnavailable(f"HTTP {response.status_code} from {response.url}")
+    try:
+        data = response.json()
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def ssb_messages(data):
+    messages = []
+    for key in ('message', 'failureMessages', 'messages'):
+        value = data.get(key)
+        if isinstance(value, str) and value:
+            messages.append(value)
+        elif isinstance(value, list):
+            messages.extend(item.get('message', '') if isinstance(item, dict) else str(item) for item in value)
+    return [message for message in messages if message]
+
+def try_http_registration(job_id, job, credentials, rehearsal=None):
+    session_cookies = credentials['session_cookies']
+    cookies_expiry = credentials['cookies_expiry']
+    if not session_cookies or not cookies_expiry or cookies_expiry <= datetime.datetime.utcnow():
+        raise EngineUnavailable("no valid saved cookies")
+    
+    account_lock = http_account_lock(credentials['gw_username'])
+    if not account_lock.acquire(timeout=REHEARSAL_CANCEL_TIMEOUT):
+        raise EngineUnavailable("another run for this account is still in progress")
+    
+    try:
+        http_session = new_http_session(json.loads(session_cookies))
+        unique_session_id = secrets.token_hex(5) + str(int(time.time() * 1000))
+        rehearsal_step(rehearsal, 'http_session')
+        
+        try:
+            models = prepare_http_registration(job_id, job, http_session, unique_session_id, rehearsal)
+        except requests.RequestException as e:
+            raise EngineUnavailable(str(e))
+        
+        if models is None or rehearsal is not None:
+            return models is not None
+        
+        return submit_http_registration(job_id, http_session, unique_session_id, models)
+    finally:
+        account_lock.release()
+
+def prepare_http_registration(job_id, job, http_session, unique_session_id, rehearsal):
+    base_url = app.config['SSB_BASE_URL']
+    
+    response = http_session.get(f"{base_url}/ssb/term/termSelection", params={'mode': 'registration'}, timeout=HTTP_ENGINE_TIMEOUT)
+    token = synchronizer_token(response.text)
+    if response.status_code >= 400 or not token:
+        raise EngineUnavailable("saved cookies were not accepted by term selection")
+    http_session.headers['X-Synchronizer-Token'] = token
+    log_job_message(job_id, "Loaded term selection over HTTP")
+    rehearsal_step(rehearsal, 'term_selection_page')
+    
+    if job.term:
+        data = ssb_json(http_session.post(f"{base_url}/ssb/term/search", params={'mode': 'registration'}, data={
+            'term': job.term,
+            'studyPath': '',
+            'studyPathText': '',
+            'startDatepicker': '',
+            'endDatepicker': '',
+            'uniqueSessionId': unique_session_id
+        }, timeout=HTTP_ENGINE_TIMEOUT))
+        if data is None:
+            raise EngineUnavailable("unexpected term selection response")
+        if data.get('regAllowed') is False or data.get('failureMessages'):
+            registration_failed(job_id, rehearsal, f"Could not select term: {'; '.join(ssb_messages(data)) or 'registration not allowed'}")
+            return None
+        log_job_message(job_id, f"Selected term: {job.term}")
+        rehearsal_step(rehearsal, 'select_term')
+    
+    response = http_session.get(f"{base_url}/ssb/classRegistration/classRegistration", timeout=HTTP_ENGINE_TIMEOUT)
+    if response.status_code >= 400:
+        raise EngineUnavailable(f"HTTP {response.status_code} from class registration")
+    http_session.headers['X-Synchronizer-Token'] = synchronizer_token(response.text) or token
+    rehearsal_step(rehearsal, 'class_registration_page')
+    
+    crns = json.loads(job.crns)
+    log_job_message(job_id, f"Attempting to register for CRNs: {', '.join(crns)}")
+    
+    if rehearsal is not None:
+        for crn in crns:
+            data = ssb_json(http_session.get(f"{base_url}/ssb/classRegistration/getSectionDetailsFromCRN", params={
+                'courseReferenceNumber': crn,
+                'term': job.term or ''
+            }, timeout=HTTP_ENGINE_TIMEOUT))
+            if data is None:
+                raise EngineUnavailable(f"unexpected response looking up CRN {crn}")
+            if not data.get('success'):
+                registration_failed(job_id, rehearsal, f"Error looking up CRN {crn}: {'; '.join(ssb_messages(data)) or 'not found'}")
+                return None
+        rehearsal_step(rehearsal, 'lookup_crns')
+        log_job_message(job_id, "Dry run: all CRNs found, stopping before submit")
+        return []
+    
+    models = []
+    for crn in crns:
+        data = ssb_json(http_session.get(f"{base_url}/ssb/classRegistration/addRegistrationItem", params={
+            'term': job.term or '',
+            'courseReferenceNumber': crn,
+            'olr': 'false'
+        }, timeout=HTTP_ENGINE_TIMEOUT))
+        if data is None:
+            raise EngineUnavailable(f"unexpected response adding CRN {crn}")
+        if not data.get('success'):
+            registration_failed(job_id, rehearsal, f"Error entering CRN {crn}: {'; '.join(ssb_messages(data))}")
+            return None
+        model = data.get('model')
+        if not isinstance(model, dict):
+            raise EngineUnavailable(f"no registration model returned for CRN {crn}")
+        model['selectedAction'] = model.get('selectedAction') or 'RW'
+        models.append(model)
+        log_job_message(job_id, f"Entered CRN {crn}")
+    return models
+
+def submit_http_registration(job_id, http_session, unique_session_id, models):
+    try:
+        response = http_session.post(f"{app.config['SSB_BASE_URL']}/ssb/classRegistration/submitRegistration/batch", json={
+            'create': [],
+            'update': models,
+            'destroy': [],
+            'uniqueSessionId': unique_session_id
+        }, timeout=HTTP_ENGINE_TIMEOUT)
+    except requests.RequestException as e:
+        log_job_message(job_id, f"❌ Registration submit did not complete, the batch may or may not have been accepted: {e}", 'error')
+        return False
+    log_job_message(job_id, "Submitted registration batch")
+    
+    if response.status_code >= 400:
+        log_job_message(job_id, f"❌ Registration submit returned HTTP {response.status_code}: {response.text[:300]}...", 'error')
+        return False
+    
+    try:
+        data = response.json()
+    except ValueError:
+        data = None
+    
+    if not isinstance(data, dict):
+        has_success, has_error = registration_page_outcome(response.text)
+        if has_success and not has_error:
+            log_job_message(job_id, "✅ Registration appears successful!")
+            return True
+        log_job_message(job_id, f"❌ Registration failed. Response: {response.text[:300]}...")
+        return False
+    
+    batch = data.get('data')
+    results = batch.get('update') if isinstance(batch, dict) else None
+    if not isinstance(results, list) or not results:
+        log_job_message(job_id, f"⚠️ Registration status unclear. Response: {response.text[:300]}...")
+        return False
+    
+    failures = []
+    for result in results:
+        if not isinstance(result, dict):
+            failures.append(f"unexpected result {result!r}")
+            continue
+        crn = result.get('courseReferenceNumber')
+        status = result.get('statusDescription') or result.get('statusIndicator')
+        if result.get('statusIndicator') == 'R' or status == 'Registered':
+            log_job_message(job_id, f"CRN {crn}: {status}")
+        else:
+            failures.append(f"CRN {crn}: {'; '.join(ssb_messages(result)) or status}")
+    
+    if failures:
+        log_job_message(job_id, f"❌ Registration failed with errors: {'; '.join(failures)}")
+        return False
+    
+    log_job_message(job_id, "✅ Registration appears successful!")
+    return True
+
+REGISTRATION_ENGINES = {
+    'http': try_http_registration,
+    'selenium': try_selenium_registration
+}
+
+active_rehearsals = {}
+active_rehearsals_lock = threading.Lock()
+
+def rehearsal_window_open(job):
+    rehearsal_deadline = job.scheduled_time - datetime.timedelta(minutes=app.config['REHEARSAL_LEAD_MINUTES'])
+    return server_utcnow() < rehearsal_deadline
+
+def cancel_rehearsal(job_id):
+    with active_rehearsals_lock:
+        active = active_rehearsals.get(job_id)
+    if active:
+        cancelled, done = active
+        cancelled.set()
+        log_job_message(job_id, "Cancelling rehearsal still in progress", 'warning')
+        done.wait(REHEARSAL_CANCEL_TIMEOUT)
+
+def rehearse_job(job_id):
+    cancelled = threading.Event()
+    done = threading.Event()
+    with active_rehearsals_lock:
+        if job_id in active_rehearsals:
+            return
+        active_rehearsals[job_id] = (cancelled, done)
+    
+    try:
+        run_rehearsal(job_id, cancelled)
+    finally:
+        with active_rehearsals_lock:
+            active_rehearsals.pop(job_id, None)
+        done.set()
+
+def run_rehearsal(job_id, cancelled):
+    job = RegistrationJob.query.get(job_id)
+    if not job or job.status != 'pending':
+        return
+    
+    log_job_message(job_id, "Starting dry-run rehearsal (will stop before submit)")
+    
+    started = time.monotonic()
+    rehearsal = {'steps': [], 'problems': [], 'last_mark': started, 'cancelled': cancelled}
+    try:
+        with profiled_attempt(job_id, 'rehearsal'):
+            ready = try_registration(job_id, job, rehearsal=rehearsal) and not rehearsal['problems']
+    except RehearsalCancelled:
+        ready = False
+    total_seconds = round(time.monotonic() - started, 2)
+    
+    if cancelled.is_set():
+        log_job_message(job_id, "Rehearsal cancelled because the registration run started", 'warning')
+        return
+    
+    job.rehearsal_status = 'ready' if ready else 'at_risk'
+    job.rehearsed_at = datetime.datetime.utcnow()
+    job.rehearsal_report = json.dumps({
+        'steps': rehearsal['steps'],
+        'problems': rehearsal['problems'],
+        'total_seconds': total_seconds
+    })
+    db.session.commit()
+    
+    if ready:
+        log_job_message(job_id, f"Rehearsal passed in {total_seconds}s - job is ready")
+    else:
+        log_job_message(job_id, f"Rehearsal found problems: {'; '.join(rehearsal['problems'])}", 'warning')
+
+def start_background_job(action, job_id):
+    def run():
+        with app.app_context():
+            action(job_id)
+    
+    threading.Thread(target=run, daemon=True).start()
+
+clock_calibration = {
+    'offset': 0.0,
+    'uncertainty': None,
+    'samples': 0,
+    'reference': None,
+    'calibrated_at': None,
+    'error': None
+}
+clock_calibration_lock = threading.Lock()
+
+def server_time():
+    with clock_calibration_lock:
+        return time.time() + clock_calibration['offset']
+
+def server_utcnow():
+    return datetime.datetime.fromtimestamp(server_time(), datetime.timezone.utc).replace(tzinfo=None)
+
+def clock_status():
+    with clock_calibration_lock:
+        status = dict(clock_calibration)
+    status['calibrated_at'] = utc_isoformat(status['calibrated_at'])
+    return status
+
+def sample_http_date_offset(url, samples):
+    bounds = []
+    with requests.Session() as http_session:
+        http_session.head(url, timeout=CLOCK_SAMPLE_TIMEOUT, allow_redirects=False)
+        for _ in range(samples):
+            time.sleep(1.0 / samples)
+            sent = time.time()
+            response = http_session.head(url, timeout=CLOCK_SAMPLE_TIMEOUT, allow_redirects=False)
+            received = time.time()
+            server_date = response.headers.get('Date')
+            if not server_date:
+                raise ValueError(f"{url} did not send a Date header")
+            stamp = email.utils.parsedate_to_datetime(server_date).timestamp()
+            bounds.append((stamp - received, stamp + 1 - sent))
+    return bounds
+
+def sample_ntp_offset(host, port, samples):
+    bounds = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(CLOCK_SAMPLE_TIMEOUT)
+        for _ in range(samples):
+            sent = time.time()
+            sock.sendto(b'\x1b' + 47 * b'\0', (host, port))
+            packet, _ = sock.recvfrom(48)
+            received = time.time()
+            if len(packet) < 48:
+                raise ValueError(f"short NTP reply from {host} ({len(packet)} bytes)")
+            server_received, server_sent = [
+                seconds + fraction / 2 ** 32 - NTP_EPOCH_DELTA
+                for seconds, fraction in (struct.unpack('!II', packet[32:40]), struct.unpack('!II', packet[40:48]))
+            ]
+            offset = ((server_received - sent) + (server_sent - received)) / 2
+            delay = (received - sent) - (server_sent - server_received)
+            bounds.append((offset - delay / 2, offset + delay / 2))
+    return bounds
+
+def combine_offset_bounds(bounds):
+    low = max(bound[0] for bound in bounds)
+    high = min(bound[1] for bound in bounds)
+    if low <= high:
+        return (low + high) / 2, (high - low) / 2
+    
+    midpoints = sorted((bound[0] + bound[1]) / 2 for bound in bounds)
+    return midpoints[len(midpoints) // 2], max((bound[1] - bound[0]) / 2 for bound in bounds)
+
+def calibrate_clock():
+    reference = app.config['CLOCK_REFERENCE']
+    samples = app.config['CLOCK_CALIBRATION_SAMPLES']
+    
+    try:
+        if reference.startswith('ntp://'):
+            host, _, port = reference[len('ntp://'):].partition(':')
+            bounds = sample_ntp_offset(host, int(port or 123), samples)
+        else:
+            bounds = sample_http_date_offset(reference, samples)
+        offset, uncertainty = combine_offset_bounds(bounds)
+    except (requests.RequestException, OSError, ValueError, TypeError) as e:
+        print(f"Clock calibration error: {e}")
+        with clock_calibration_lock:
+            clock_calibration['error'] = f"{reference}: {e}"
+        return
+    
+    with clock_calibration_lock:
+        clock_calibration.update({
+            'offset': offset,
+            'uncertainty': uncertainty,
+            'samples': len(bounds),
+            'reference': reference,
+            'calibrated_at': datetime.datetime.utcnow(),
+            'error': None
+        })
+
+def start_clock_calibration():
+    threading.Thread(target=calibrate_clock, daemon=True).start()
+
+scheduled_runs = []
+scheduled_runs_lock = threading.Lock()
+scheduled_runs_changed = threading.Event()
+scheduled_run_counter = itertools.count()
+
+def queue_scheduled_run(run_at, action, job_id):
+    run_at_timestamp = run_at.replace(tzinfo=datetime.timezone.utc).timestamp()
+    with scheduled_runs_lock:
+        heapq.heappush(scheduled_runs, (run_at_timestamp, next(scheduled_run_counter), action, job_id))
+    scheduled_runs_changed.set()
+
 def schedule_job(job_id):
     job = RegistrationJob.query.get(job_id)
     if not job:
         return
     
-    def run_job():
-        execute_registration_job(job_id)
-    
-    local_time = job.scheduled_time.replace(tzinfo=None)
-    schedule.every().day.at(local_time.strftime("%H:%M")).do(run_job)
+    for message in add_to_scheduler(job):
+        log_job_message(job_id, message)
+
+def schedule_jobs(jobs):
+    for job in jobs:
+        for message in add_to_scheduler(job):
+            db.session.add(RegistrationLog(job_id=job.id, message=message))
+    db.session.commit()
+
+def add_to_scheduler(job):
+    queue_scheduled_run(job.scheduled_time, execute_registration_job, job.id)
+    messages = [f"Job scheduled for {job.scheduled_time} UTC"]
     
-    log_job_message(job_id, f"Job scheduled for {local_time}")
+    if job.rehearse:
+        lead_minutes = app.config['REHEARSAL_LEAD_MINUTES']
+        if rehearsal_window_open(job):
+            queue_scheduled_run(job.scheduled_time - datetime.timedelta(minutes=lead_minutes), rehearse_job, job.id)
+            messages.append(f"Rehearsal scheduled {lead_minutes} minutes before the scheduled time")
+        else:
+            messages.append(f"Rehearsal skipped: less than {lead_minutes} minutes before the scheduled time")
+    return messages
 
 def run_scheduler():
+    start_clock_calibration()
+    schedule.every(app.config['CLOCK_CALIBRATION_MINUTES']).minutes.do(start_clock_calibration)
+    
     while True:
         schedule.run_pending()
-        time.sleep(1)
+        
+        now = server_time()
+        due = []
+        with scheduled_runs_lock:
+            while scheduled_runs and scheduled_runs[0][0] <= now:
+                due.append(heapq.heappop(scheduled_runs))
+            next_run = scheduled_runs[0][0] if scheduled_runs else None
+            scheduled_runs_changed.clear()
+        
+        for _, _, action, job_id in due:
+            start_background_job(action, job_id)
+        
+        wait = 1 if next_run is None else min(1, max(0, next_run - server_time()))
+        scheduled_runs_changed.wait(wait)
 
 scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
 scheduler_thread.start()
 
+def add_missing_columns():
+    with db.engine.begin() as connection:
+        for table in (RegistrationJob.__table__,):
+            existing = {column['name'] for column in inspect(connection).get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=connection.dialect)
+                    connection.execute(db.text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                    print(f"Added missing column {table.name}.{column.name}")
+
 def cleanup():
     pass
 
@@ -693,6 +1537,7 @@ atexit.register(cleanup)
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
+        add_missing_columns()
     
     print("Starting GW Auto-Registration Server...")
     print("Access the application at: http://localhost:8080")
@@ -0,0 +1,93 @@
+
+from flask import Flask, request, jsonify
+
+SESSION_COOKIE = 'JSESSIONID'
+SESSION_VALUE = 'standin-session'
+
+def create_standin_app():
+    app = Flask('ssb_standin')
+    app.config['SCENARIO'] = default_scenario()
+
+    def scenario():
+        return app.config['SCENARIO']
+
+    def token_ok(expected):
+        return request.headers.get('X-Synchronizer-Token') == expected
+
+    @app.route('/ssb/term/termSelection')
+    def term_selection():
+        if request.cookies.get(SESSION_COOKIE) != SESSION_VALUE:
+            return '<html><body>Please log in</body></html>'
+        return '<html><head><meta name="synchronizerToken" content="term-token"></head></html>'
+
+    @app.route('/ssb/term/search', methods=['POST'])
+    def term_search():
+        if not token_ok('term-token'):
+            return jsonify({'error': 'bad token'}), 403
+        if scenario()['term_search_list']:
+            return jsonify([{'fwdURL': '/ssb/classRegistration/classRegistration'}])
+        if request.form.get('term') in scenario()['rejected_terms']:
+            return jsonify({'regAllowed': False, 'failureMessages': ['Term not open for registration']})
+        return jsonify({'fwdURL': '/ssb/classRegistration/classRegistration'})
+
+    @app.route('/ssb/classRegistration/classRegistration')
+    def class_registration():
+        return '<html><head><meta content="registration-token" name="synchronizerToken"></head></html>'
+
+    @app.route('/ssb/classRegistration/getSectionDetailsFromCRN')
+    def section_details():
+        crn = request.args.get('courseReferenceNumber')
+        if crn in scenario()['unknown_crns']:
+            return jsonify({'success': False, 'message': f'CRN {crn} does not exist'})
+        return jsonify({'success': True, 'courseReferenceNumber': crn})
+
+    @app.route('/ssb/classRegistration/addRegistrationItem')
+    def add_registration_item():
+        if not token_ok('registration-token'):
+            return jsonify({'error': 'bad token'}), 403
+        crn = request.args.get('courseReferenceNumber')
+        if scenario()['omit_model']:
+            return jsonify({'success': True})
+        return jsonify({'success': True, 'model': {'courseReferenceNumber': crn, 'selectedAction': None}})
+
+    @app.route('/ssb/classRegistration/submitRegistration/batch', methods=['POST'])
+    def submit_batch():
+        scenario()['submissions'] += 1
+        if scenario()['batch_status'] != 200:
+            return jsonify({'error': 'server error'}), scenario()['batch_status']
+        if scenario()['batch_data_list']:
+            return jsonify({'data': []})
+
+        results = []
+        for model in request.get_json()['update']:
+            crn = model['courseReferenceNumber']
+            if model.get('selectedAction') != 'RW':
+                results.append({'courseReferenceNumber': crn, 'statusIndicator': 'F', 'statusDescription': 'No action selected'})
+            elif crn in scenario()['closed_crns']:
+                results.append({
+                    'courseReferenceNumber': crn,
+                    'statusIndicator': 'F',
+                    'statusDescription': 'Errors Preventing Registration',
+                    'messages': [{'message': 'Closed Section'}]
+                })
+            else:
+                results.append({'courseReferenceNumber': crn, 'statusIndicator': 'R', 'statusDescription': 'Registered'})
+        return jsonify({'data': {'update': results}})
+
+    return app
+
+def default_scenario():
+    return {
+        'closed_crns': set(),
+        'unknown_crns': set(),
+        'rejected_terms': set(),
+        'term_search_list': False,
+        'omit_model': False,
+        'batch_status': 200,
+        'batch_data_list': False,
+        'submissions': 0
+    }
+
+if __name__ == '__main__':
+    print("Starting SSB stand-in at http://localhost:8090 (set SSB_BASE_URL to this address)")
+    create_standin_app().run(host='127.0.0.1', port=8090)
@@ -0,0 +1,90 @@
+
+import os
+import sys
+import json
+import time
+import datetime
+import threading
+from werkzeug.serving import make_server
+
+from ssb_standin import create_standin_app, default_scenario, SESSION_COOKIE, SESSION_VALUE
+
+def start_standin():
+    standin = create_standin_app()
+    server = make_server('127.0.0.1', 0, standin)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return standin, f"http://127.0.0.1:{server.server_port}"
+
+standin, base_url = start_standin()
+os.environ['SSB_BASE_URL'] = base_url
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from server_app import app, db, RegistrationJob, EngineUnavailable, try_http_registration
+
+def credentials(session_value=SESSION_VALUE):
+    return {
+        'user': None,
+        'gw_username': 'standin-user',
+        'gw_password': 'unused',
+        'session_cookies': json.dumps([{'name': SESSION_COOKIE, 'value': session_value, 'domain': '127.0.0.1', 'path': '/'}]),
+        'cookies_expiry': datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+    }
+
+def run_case(crns, term='202510', rehearse=False, session_value=SESSION_VALUE, **scenario):
+    standin.config['SCENARIO'] = dict(default_scenario(), **scenario)
+    job = RegistrationJob(crns=json.dumps(crns), scheduled_time=datetime.datetime.utcnow(), term=term)
+    db.session.add(job)
+    db.session.commit()
+
+    rehearsal = {'steps': [], 'problems': [], 'last_mark': time.monotonic(), 'cancelled': threading.Event()} if rehearse else None
+    try:
+        result = try_http_registration(job.id, job, credentials(session_value), rehearsal)
+    except EngineUnavailable as e:
+        result = EngineUnavailable(str(e))
+    return result, rehearsal, standin.config['SCENARIO']['submissions']
+
+def check(name, passed, detail):
+    print(f"{'✓' if passed else '❌'} {name}: {detail}")
+    return passed
+
+def main():
+    results = []
+    with app.app_context():
+        db.create_all()
+
+        result, _, submissions = run_case(['10001', '10002'])
+        results.append(check("success", result is True and submissions == 1, result))
+
+        result, _, submissions = run_case(['10001', '10002'], closed_crns={'10002'})
+        results.append(check("closed section", result is False and submissions == 1, result))
+
+        result, _, submissions = run_case(['10001'], term='bad-term', rejected_terms={'bad-term'})
+        results.append(check("rejected term", result is False and submissions == 0, result))
+
+        result, rehearsal, submissions = run_case(['10001'], rehearse=True)
+        results.append(check("rehearsal ready", result is True and not rehearsal['problems'] and submissions == 0, rehearsal['steps']))
+
+        result, rehearsal, submissions = run_case(['10001', '99999'], rehearse=True, unknown_crns={'99999'})
+        results.append(check("rehearsal unknown CRN", result is False and rehearsal['problems'] and submissions == 0, rehearsal['problems']))
+
+        result, _, submissions = run_case(['10001'], session_value='expired')
+        results.append(check("rejected cookies fall back", isinstance(result, EngineUnavailable) and submissions == 0, result))
+
+        result, _, submissions = run_case(['10001'], term_search_list=True)
+        results.append(check("term search returns a list", isinstance(result, EngineUnavailable) and submissions == 0, result))
+
+        result, _, submissions = run_case(['10001'], omit_model=True)
+        results.append(check("add item without model", isinstance(result, EngineUnavailable) and submissions == 0, result))
+
+        result, _, submissions = run_case(['10001'], batch_status=500)
+        results.append(check("submit error does not fall back", result is False and submissions == 1, result))
+
+        result, _, submissions = run_case(['10001'], batch_data_list=True)
+        results.append(check("malformed submit result", result is False and submissions == 1, result))
+
+    print(f"\n{sum(results)}/{len(results)} stand-in checks passed")
+    if not all(results):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()